@@ -4,12 +4,16 @@
 """Module defining base testing utilities for the library/child charms."""
 
 import abc
+import base64
+import functools
 import json
+import types
 import unittest
 from unittest import mock
 
 import yaml
 from charms.finos_legend_libs.v0 import legend_operator_base
+from OpenSSL import crypto
 from ops import model
 from ops import testing as ops_testing
 
@@ -21,8 +25,17 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 7
+LIBPATCH = 8
 
+# Names of the `legend_operator_base` utility functions mocked during testing:
+_UTILITY_FUNCTIONS_TO_PATCH = (
+    'create_jks_truststore_with_certificates',
+    'add_file_to_container',
+    'parse_base64_certificate',
+    'get_ip_address')
+
+# Use the LibYAML-backed dumper when PyYAML was built with it:
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 TEST_CERTIFICATE_BASE64 = """
 MIIDMTCCAhmgAwIBAgIULab4sJerDL5F2FtcQBTxkhPDs1EwDQYJKoZIhvcNAQELBQAwSDELMAkG
@@ -42,8 +55,31 @@ BanzjI7vm6nh29V8Z4VGpH7mRhZ69+AnHRhG7rrV97WuBN3DnPq+YpOgJv6Og5bln1DOndbG+Xb7
 noMqQQqz5jpU2SD5w0+nqOctqS2GvEk=
 """
 
-# NOTE: `legend_operator_base.parse_base64_certificate` is independently unit tested.
-TEST_CERTIFICATE = legend_operator_base.parse_base64_certificate(TEST_CERTIFICATE_BASE64)
+
+# NOTE: `base64.b64decode` discards the newlines within the certificate.
+_TEST_CERTIFICATE_DER = base64.b64decode(TEST_CERTIFICATE_BASE64)
+
+
+@functools.lru_cache(maxsize=1)
+def _test_certificate():
+    """Returns the parsed `TEST_CERTIFICATE_BASE64`, only parsing it on first use."""
+    # NOTE: this must not go through `legend_operator_base.parse_base64_certificate`
+    # (which is independently unit tested), as the first call usually happens while
+    # it is mocked, and the cache would then hold the mock's return value.
+    return crypto.load_certificate(crypto.FILETYPE_ASN1, _TEST_CERTIFICATE_DER)
+
+
+def __getattr__(name):
+    """Lazily provides `TEST_CERTIFICATE` for child charm tests still importing it."""
+    if name == "TEST_CERTIFICATE":
+        return _test_certificate()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+# Read-only view of the service configs the test charms write:
+_DEFAULT_SERVICE_CONFIGS = types.MappingProxyType({
+    "/legend-test-1.json": '{"some": "json"}',
+    "/legend-test-2.ini": "[section]\nwith_some = options"})
 
 
 class BaseFinosLegendTestCharm(legend_operator_base.BaseFinosLegendCharm):
@@ -79,29 +115,34 @@ class BaseFinosLegendTestCharm(legend_operator_base.BaseFinosLegendCharm):
         return ["legend-test-service"]
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _get_workload_pebble_layers(cls):
-        return {
-            service_name: {
+        # NOTE: the layers only depend on the class, so they are built once per
+        # class. They are shared between all tests, so each layer is kept as an
+        # (immutable) YAML string, which `Container.add_layer` accepts as is.
+        return types.MappingProxyType({
+            service_name: yaml.dump({
                 "services": {
                     service_name: {
-                        "command": "bash -c 'echo yes'"}}}
-            for service_name in cls._get_workload_service_names()}
+                        "command": "bash -c 'echo yes'"}}}, Dumper=_YAML_DUMPER)
+            for service_name in cls._get_workload_service_names()})
 
     def _get_jks_truststore_preferences(self):
         return {
             "truststore_path": "/path/to/truststore.jks",
             "truststore_passphrase": "legend-test",
             "trusted_certificates": {
-                "testing-cert-1": TEST_CERTIFICATE}}
+                "testing-cert-1": _test_certificate()}}
 
     def _get_service_configs(self, relations_data):
         return self._get_service_configs_clone(relations_data)
 
     def _get_service_configs_clone(self, relations_data):
-        """Shadow method for `_get_service_configs` to avoid calling it during testing."""
-        return {
-            "/legend-test-1.json": '{"some": "json"}',
-            "/legend-test-2.ini": "[section]\nwith_some = options"}
+        """Shadow method for `_get_service_configs` to avoid calling it during testing.
+
+        Returns a shared read-only mapping; use `dict()` on it if a mutable copy is needed.
+        """
+        return _DEFAULT_SERVICE_CONFIGS
 
 
 class BaseFinosLegendCharmTestCase(unittest.TestCase):
@@ -109,6 +150,7 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
 
     This class offers the following functionality:
     * automatically setting up mocks for the utility functions from `legend_operator_base`.
+      These are patched once per class in `setUpClass` and reset before every test.
     * skeleton tests which cover all abstract methods which child classes of
       `legend_operator_base.BaseFinosLegendCharm` should have.
     * some utility methods for testing
@@ -117,19 +159,34 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
     Note that the class you pass to the harness must be an instance of
     `BaseFinosLegendTestCharm`.
     Note that neither `begin` nor `begin_with_initial_hooks` are called during `setUp`.
+
+    Every test gets its own harness, and the class-wide mocks are reset before each test
+    and set up in every process, so the tests do not depend on each other and can be
+    distributed with `pytest-xdist` (`pytest -n auto`).
     """
 
     MOCK_TRUSTSTORE_DATA = "Mock Legend JKS TrustStore data."
 
+    @classmethod
+    def setUpClass(cls):
+        """Sets up the mocks for the utility methods once for the whole testcase class."""
+        super().setUpClass()
+
+        cls._k8s_svc_patch_mock = cls._class_patch(
+            legend_operator_base.k8s_svc_patch, 'KubernetesServicePatch')
+
+        cls._set_up_utils_patches()
+
     def setUp(self):
-        """Sets up the testcase by mocking utility methods and calling `_set_up_harness()`."""
+        """Sets up the testcase by resetting utility mocks and calling `_set_up_harness()`."""
         super().setUp()
 
-        self.patch(legend_operator_base.k8s_svc_patch, 'KubernetesServicePatch')
-
         self._set_up_utils_mocks()
 
+        # NOTE: the harness holds all the charm/model state so it must be
+        # rebuilt for each test. Only the (stateless) mocks are shared.
         self.harness = self._set_up_harness()
+        self.addCleanup(self.harness.cleanup)
 
     def patch(self, obj, method):
         """Returns a Mock for the given method name."""
@@ -138,53 +195,79 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
         self.addCleanup(_m.stop)
         return mck
 
+    @classmethod
+    def _class_patch(cls, obj, method):
+        """Returns a Mock for the given method name which is active for the whole class."""
+        _m = mock.patch.object(obj, method)
+        mck = _m.start()
+        cls.addClassCleanup(_m.stop)
+        return mck
+
     @classmethod
     @abc.abstractmethod
     def _set_up_harness(cls):
         """Returns an `ops_testing.Harness` instance."""
         raise NotImplementedError("No harness setup implemented.")
 
+    @classmethod
+    def _set_up_utils_patches(cls):
+        """Patches all the utility methods in the library for the whole class."""
+        # NOTE: the utilities are only ever called, so plain `Mock`s suffice:
+        patcher = mock.patch.multiple(
+            legend_operator_base, new_callable=mock.Mock,
+            **dict.fromkeys(_UTILITY_FUNCTIONS_TO_PATCH, mock.DEFAULT))
+        cls._utils_mocks = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        for item, mocked in cls._utils_mocks.items():
+            setattr(cls, "mocked_%s" % item, mocked)
+
     def _set_up_utils_mocks(self):
-        """Sets up mocks for all the utility methods in the library."""
-        utility_funtions_to_patch = [
-            'create_jks_truststore_with_certificates',
-            'add_file_to_container',
-            'parse_base64_certificate',
-            'get_ip_address']
-        for item in utility_funtions_to_patch:
-            setattr(self, "mocked_%s" % item, self.patch(legend_operator_base, item))
-        self.truststore_mock = mock.MagicMock()
+        """Resets and configures the mocks for all the utility methods in the library."""
+        self._k8s_svc_patch_mock.reset_mock(return_value=True, side_effect=True)
+        for mocked in self._utils_mocks.values():
+            mocked.reset_mock(return_value=True, side_effect=True)
+        self.truststore_mock = mock.Mock(spec_set=['saves'])
         self.truststore_mock.saves.return_value = self.MOCK_TRUSTSTORE_DATA
         self.mocked_create_jks_truststore_with_certificates.return_value = (
             self.truststore_mock)
         self.mocked_add_file_to_container.return_value = True
-        self.mocked_parse_base64_certificate.return_value = TEST_CERTIFICATE
+        self.mocked_parse_base64_certificate.return_value = _test_certificate()
+
+    def _workload_container(self):
+        """Returns the workload `model.Container` of the current harness."""
+        return self.harness.model.unit.get_container(
+            self.harness.charm._get_workload_container_name())
 
     def _emit_container_ready(self):
+        # NOTE: the event source is bound to the current charm instance, so it
+        # is deliberately not cached in case a test rebuilds `self.harness`.
         container_name = self.harness.charm._get_workload_container_name()
-        container = self.harness.model.unit.get_container(container_name)
-        getattr(self.harness.charm.on, "%s_pebble_ready" % container_name).emit(container)
+        getattr(self.harness.charm.on, "%s_pebble_ready" % container_name).emit(
+            self._workload_container())
 
     def _test_workload_container(self):
         self.harness.begin_with_initial_hooks()
         self.assertEqual(
-            self.harness.charm._workload_container,
-            self.harness.model.unit.get_container(
-                self.harness.charm._get_workload_container_name()))
+            self.harness.charm._workload_container, self._workload_container())
 
     def _test_get_logging_level_from_config(self):
         option_name = "log-level-option"
         self.harness.begin_with_initial_hooks()
-        # Test all valid options:
-        for log_opt in legend_operator_base.VALID_APPLICATION_LOG_LEVEL_SETTINGS:
-            self.harness.update_config({option_name: log_opt})
-            self.assertEqual(
-                self.harness.charm._get_logging_level_from_config(option_name), log_opt)
-
-        # Invalid test:
-        self.harness.update_config({option_name: '13'})
-        self.assertIsNone(
-            self.harness.charm._get_logging_level_from_config(option_name))
+        # NOTE: only the config values are read here, so there is no need
+        # to have every update re-run the charm's config-changed handling.
+        with self.harness.hooks_disabled():
+            # Test all valid options:
+            for log_opt in legend_operator_base.VALID_APPLICATION_LOG_LEVEL_SETTINGS:
+                with self.subTest(log_opt=log_opt):
+                    self.harness.update_config({option_name: log_opt})
+                    self.assertEqual(
+                        self.harness.charm._get_logging_level_from_config(option_name),
+                        log_opt)
+
+            # Invalid test:
+            self.harness.update_config({option_name: '13'})
+            self.assertIsNone(
+                self.harness.charm._get_logging_level_from_config(option_name))
 
     def _test_get_relation(self):
         self.harness.begin_with_initial_hooks()
@@ -203,7 +286,7 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
             self.assertTrue(self.harness.charm._get_relation(relation_name, rel_id))
 
         # Check duplicate relation:
-        relation_name = list(relations_test_data.keys())[-1]
+        relation_name = next(reversed(relations_test_data), None)
         if relation_name:
             # Should work as there's no relation:
             self.assertTrue(self.harness.charm._get_relation(relation_name))
@@ -224,7 +307,7 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
     def _test_setup_jks_truststore(self):
         self.harness.begin()
 
-        container = mock.MagicMock()
+        container = mock.Mock(spec_set=[])
         add_files_mock = self.mocked_add_file_to_container
         add_files_mock.return_value = True
 
@@ -278,71 +361,93 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
             rel_id, relator_name, relation_data)
         return rel_id
 
-    @mock.patch("ops.testing._TestingPebbleClient.restart_services")
-    @mock.patch("ops.testing._TestingPebbleClient.stop_services")
-    def _test_relations_waiting(self, _container_stop_mock, _container_restart_mock):
+    def _add_relations_without_hooks(self, relations_data):
+        """Adds all the given relations without firing any of their hooks.
+
+        Useful for quickly adding multiple relations and only having the charm
+        reconcile once afterwards (e.g. through `self.harness.update_config()`).
+
+        Returns:
+            dict mapping the names of the added relations to their IDs.
+        """
+        with self.harness.hooks_disabled():
+            return {
+                rel_name: self._add_relation(rel_name, rel_data)
+                for rel_name, rel_data in relations_data.items()}
+
+    @mock.patch.multiple(
+        "ops.testing._TestingPebbleClient", new_callable=mock.Mock,
+        restart_services=mock.DEFAULT, stop_services=mock.DEFAULT)
+    def _test_relations_waiting(self, restart_services, stop_services):
         """Progressively adds relations and tests that charm class behaves accordingly.
 
         Args:
-            _container_stop_mock: mock of `ops.testing._TestingPebbleClient.stop_services`
-            _container_restart_mock: mock of `ops.testing._TestingPebbleClient.restart_services`
+            restart_services: mock of `ops.testing._TestingPebbleClient.restart_services`
+            stop_services: mock of `ops.testing._TestingPebbleClient.stop_services`
         """
-        def _check_charm_missing_relations(relation_names):
+        def _check_charm_missing_relations(missing_relations_str):
             # We initially expect it to block complaining about missing relations:
             self.assertIsInstance(
                 self.harness.charm.unit.status, model.BlockedStatus)
             self.assertEqual(
                 self.harness.charm.unit.status.message,
-                "missing following relations: %s" % ", ".join(sorted(relation_names)))
+                "missing following relations: %s" % missing_relations_str)
 
             # Services should be called to stop with any non-standard status:
-            _container_stop_mock.assert_called_with(
+            stop_services.assert_called_with(
                 tuple(self.harness.charm._get_workload_service_names()))
 
         self.harness.set_leader()
         self.harness.begin_with_initial_hooks()
 
+        # Precompute the (sorted) missing relations expected after adding each relation:
+        relations_test_data = self.harness.charm._get_relations_test_data()
+        required_rels = sorted(self.harness.charm._get_required_relations())
+        added_rels = set()
+        expected_missing_rels = []
+        for rel_name in relations_test_data:
+            added_rels.add(rel_name)
+            expected_missing_rels.append(
+                ", ".join(rel for rel in required_rels if rel not in added_rels))
+
         # We initially expect it to complain about all relations:
-        _check_charm_missing_relations(self.harness.charm._get_required_relations())
+        _check_charm_missing_relations(", ".join(required_rels))
 
         # Check behavior when progressively adding relations:
-        added_rels = set()
-        required_rels = set(self.harness.charm._get_required_relations())
-        for rel_name, rel_data in self.harness.charm._get_relations_test_data().items():
+        for (rel_name, rel_data), missing_rels in zip(
+                relations_test_data.items(), expected_missing_rels):
             self._add_relation(rel_name, rel_data)
-            added_rels.add(rel_name)
             self.harness.update_config()
-            missing_rels = required_rels.difference(added_rels)
             if missing_rels:
                 _check_charm_missing_relations(missing_rels)
 
         trust_prefs = self.harness.charm._get_jks_truststore_preferences()
-        self.mocked_create_jks_truststore_with_certificates.assert_has_calls(
-            [mock.call(trust_prefs["trusted_certificates"])])
+        self.mocked_create_jks_truststore_with_certificates.assert_called_with(
+            trust_prefs["trusted_certificates"])
 
         # Check all config files present:
-        container = self.harness.charm.unit.get_container(
-            self.harness.charm._get_workload_container_name())
+        container = self._workload_container()
         config_file_write_calls = [
-            mock.call(container, path, data, make_dirs=True)
-            for path, data in self.harness.charm._get_service_configs_clone({}).items()]
-        config_file_write_calls.insert(
-            0, mock.call(
+            mock.call(
                 container, trust_prefs["truststore_path"],
-                self.MOCK_TRUSTSTORE_DATA, raise_on_error=False))
+                self.MOCK_TRUSTSTORE_DATA, raise_on_error=False)]
+        config_file_write_calls.extend(
+            mock.call(container, path, data, make_dirs=True)
+            for path, data in self.harness.charm._get_service_configs_clone({}).items())
         self.mocked_add_file_to_container.assert_has_calls(
             config_file_write_calls)
 
         # By this point, the services configs should have been written and
         # the services should have been started:
-        _container_restart_mock.assert_has_calls(
-            [mock.call(tuple(self.harness.charm._get_workload_service_names()))])
+        restart_services.assert_called_with(
+            tuple(self.harness.charm._get_workload_service_names()))
         self.assertIsInstance(
             self.harness.charm.unit.status, model.ActiveStatus)
 
-    @mock.patch("ops.testing._TestingPebbleClient.restart_services")
-    @mock.patch("ops.testing._TestingPebbleClient.stop_services")
-    def _test_update_config_gitlab_relation(self, _container_stop_mock, _container_restart_mock):
+    @mock.patch.multiple(
+        "ops.testing._TestingPebbleClient", new_callable=mock.Mock,
+        restart_services=mock.DEFAULT, stop_services=mock.DEFAULT)
+    def _test_update_config_gitlab_relation(self, **_pebble_service_mocks):
         self.harness.set_leader()
         self.harness.begin_with_initial_hooks()
 
@@ -358,9 +463,8 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
         gitlab_rel_id = self._add_relation(gitlab_rel_name, gitlab_rel_data)
 
         # Add the rest of the necessary relations.
-        for rel_name, rel_data in test_data.items():
-            self._add_relation(rel_name, rel_data)
-            self.harness.update_config()
+        self._add_relations_without_hooks(test_data)
+        self.harness.update_config()
 
         # Assert that the unit is currently active.
         self.assertIsInstance(
@@ -382,9 +486,10 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
         expected_rel_data = {'legend-gitlab-redirect-uris': json.dumps(fake_callback_uris)}
         self.assertDictEqual(expected_rel_data, relation_data)
 
-    @mock.patch("ops.testing._TestingPebbleClient.restart_services")
-    @mock.patch("ops.testing._TestingPebbleClient.stop_services")
-    def _test_upgrade_charm(self, _container_stop_mock, _container_restart_mock):
+    @mock.patch.multiple(
+        "ops.testing._TestingPebbleClient", new_callable=mock.Mock,
+        restart_services=mock.DEFAULT, stop_services=mock.DEFAULT)
+    def _test_upgrade_charm(self, **_pebble_service_mocks):
         self.harness.set_leader()
         self.harness.begin_with_initial_hooks()
 
@@ -394,9 +499,8 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
         gitlab_rel_data = test_data.pop(gitlab_rel_name)
 
         # Add the rest of the relations.
-        for rel_name, rel_data in test_data.items():
-            self._add_relation(rel_name, rel_data)
-            self.harness.update_config()
+        self._add_relations_without_hooks(test_data)
+        self.harness.update_config()
 
         # Setup for the Upgrade Charm event and emit it.
         mock_get_uris = self.patch(self.harness.charm, '_get_legend_gitlab_redirect_uris')
@@ -435,6 +539,25 @@ class BaseFinosLegendCharmTestCase(unittest.TestCase):
         self.assertDictEqual(expected_rel_data, relation_data)
 
 
+_LEGEND_DB_CREDS = {
+    "username": "test_db_user",
+    "password": "test_db_pass",
+    "database": "test_db_name",
+    "uri": "test_db_uri",
+}
+_LEGEND_GITLAB_CREDS = {
+    "gitlab_host": "gitlab_test_host",
+    "gitlab_port": 7667,
+    "gitlab_scheme": "https",
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "openid_discovery_url": "test_discovery_url",
+    "gitlab_host_cert_b64": "test_gitlab_cert",
+}
+_LEGEND_DB_CONNECTION_JSON = json.dumps(_LEGEND_DB_CREDS)
+_LEGEND_GITLAB_CONNECTION_JSON = json.dumps(_LEGEND_GITLAB_CREDS)
+
+
 class BaseFinosLegendCoreServiceTestCharm(
         legend_operator_base.BaseFinosLegendCoreServiceCharm, BaseFinosLegendTestCharm):
     """Testing Charm class for Legend services requiring Gitlab/Mongo relations."""
@@ -454,30 +577,13 @@ class BaseFinosLegendCoreServiceTestCharm(
 
     @classmethod
     def _get_relations_test_data(cls):
+        # NOTE: callers are free to mutate the returned dict, so only the
+        # JSON-encoded relation data values are shared between calls.
         return {
             cls._get_legend_db_relation_name(): {
-                "legend-db-connection": json.dumps(
-                    {
-                        "username": "test_db_user",
-                        "password": "test_db_pass",
-                        "database": "test_db_name",
-                        "uri": "test_db_uri",
-                    }
-                )
-            },
+                "legend-db-connection": _LEGEND_DB_CONNECTION_JSON},
             cls._get_legend_gitlab_relation_name(): {
-                "legend-gitlab-connection": json.dumps(
-                    {
-                        "gitlab_host": "gitlab_test_host",
-                        "gitlab_port": 7667,
-                        "gitlab_scheme": "https",
-                        "client_id": "test_client_id",
-                        "client_secret": "test_client_secret",
-                        "openid_discovery_url": "test_discovery_url",
-                        "gitlab_host_cert_b64": "test_gitlab_cert",
-                    }
-                )
-            },
+                "legend-gitlab-connection": _LEGEND_GITLAB_CONNECTION_JSON},
         }
 
     def _get_legend_gitlab_redirect_uris(self):
@@ -492,6 +598,36 @@ class BaseFinosLegendCoreServiceTestCharm(
         })
 
 
+@functools.lru_cache(maxsize=1)
+def _get_core_service_test_charm_yamls():
+    """Returns the metadata and config YAMLs for `BaseFinosLegendCoreServiceTestCharm`.
+
+    The YAMLs are constant so they are only ever serialized once.
+    """
+    rel_data = {
+        rel: {"interface": "%s-interfaces" % rel}
+        for rel in BaseFinosLegendCoreServiceTestCharm._get_required_relations()}
+    charm_meta = {
+        "name": "legend-base-test",
+        "requires": {"ingress": {"interface": "ingress"}},
+        "provides": rel_data,
+        "containers": {
+            BaseFinosLegendCoreServiceTestCharm._get_workload_container_name(): {
+                "resource": "image"}},
+        "resources": {"image": {"type": "oci-image"}}}
+    charm_config = {
+        "options": {
+            "external-hostname": {
+                "type": "string",
+                "default": "",
+            },
+        },
+    }
+    return (
+        yaml.dump(charm_meta, Dumper=_YAML_DUMPER),
+        yaml.dump(charm_config, Dumper=_YAML_DUMPER))
+
+
 class TestBaseFinosCoreServiceLegendCharm(BaseFinosLegendCharmTestCase):
     """More specialized implementation of a `BaseFinosLegendCharmTestCase`.
 
@@ -506,29 +642,9 @@ class TestBaseFinosCoreServiceLegendCharm(BaseFinosLegendCharmTestCase):
 
     @classmethod
     def _set_up_harness(cls):
-        rel_data = {
-            rel: {"interface": "%s-interfaces" % rel}
-            for rel in BaseFinosLegendCoreServiceTestCharm._get_required_relations()}
-        charm_meta = {
-            "name": "legend-base-test",
-            "requires": {"ingress": {"interface": "ingress"}},
-            "provides": rel_data,
-            "containers": {
-                BaseFinosLegendCoreServiceTestCharm._get_workload_container_name(): {
-                    "resource": "image"}},
-            "resources": {"image": {"type": "oci-image"}}}
-        charm_config = {
-            "options": {
-                "external-hostname": {
-                    "type": "string",
-                    "default": "",
-                },
-            },
-        }
+        charm_meta, charm_config = _get_core_service_test_charm_yamls()
         harness = ops_testing.Harness(
-            BaseFinosLegendCoreServiceTestCharm,
-            meta=yaml.dump(charm_meta),
-            config=yaml.dump(charm_config))
+            BaseFinosLegendCoreServiceTestCharm, meta=charm_meta, config=charm_config)
         return harness
 
     def _test_get_core_legend_service_configs(self):
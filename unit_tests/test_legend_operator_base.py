@@ -190,6 +190,14 @@ class TestBaseFinosLegendCharm(legend_operator_testing.BaseFinosLegendCharmTestC
         """Tests `legend_operator_base.BaseFinosLegendCharm._setup_jks_truststore`."""
         self._test_setup_jks_truststore()
 
+    def test_test_certificate(self):
+        """Tests the test certificate is a parsed cert even with the parsing util mocked."""
+        self.harness.begin()
+        self.assertIsInstance(legend_operator_testing.TEST_CERTIFICATE, crypto.X509)
+        truststore_prefs = self.harness.charm._get_jks_truststore_preferences()
+        for cert in truststore_prefs["trusted_certificates"].values():
+            self.assertIsInstance(cert, crypto.X509)
+
     @mock.patch("ops.testing._TestingPebbleClient.stop_services")
     def test_get_relation(self, _stop_legend_services):
         """Tests `legend_operator_base.BaseFinosLegendCharm._get_relation`."""